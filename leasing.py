@@ -4,24 +4,118 @@ Property Leasing App with SQLite (Single User Version)
 
 import sqlite3
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Optional
+import itertools
 import os
+import queue
+import re
 import shutil
+import sys
 
 DB_FILE = "leasing.db"
 DATE_FMT = "%Y-%m-%d"
 PICTURES_DIR = "property_pictures"
+CATEGORIES = ('commercial', 'residential', 'land', 'resorts', 'venues')
+
+# Statements used by the save() paths; keeping the text identical lets
+# sqlite3's statement cache reuse the compiled statement
+_SQL_INSERT_CLIENT = "INSERT INTO clients (name, email, phone, address, notes) VALUES (?, ?, ?, ?, ?)"
+_SQL_UPDATE_CLIENT = "UPDATE clients SET name=?, email=?, phone=?, address=?, notes=? WHERE id=?"
+_SQL_INSERT_RENTAL = """INSERT INTO rentals (client_id, property_id, start_date, end_date,
+    duration_months, total_amount, payment_method, payment_frequency, next_due_date, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_RENTAL = """UPDATE rentals SET client_id=?, property_id=?, start_date=?, end_date=?,
+    duration_months=?, total_amount=?, payment_method=?, payment_frequency=?,
+    next_due_date=?, status=? WHERE id=?"""
+
+# "<kind> in <address>" label, built by SQLite; land parcels have no kind.
+# IFNULL keeps a missing address from nulling the whole label, as the
+# f-string it replaces printed "None" there
+_SQL_PROPERTY_LABEL = "COALESCE(NULLIF(p.kind, ''), 'Land') || ' in ' || IFNULL(p.address, 'None')"
+
+# Read queries behind the client/rental/due-payment screens, kept as constants
+# so repeat menu visits reuse the same cached statement
+_SQL_CLIENTS_WITH_RENTALS = """
+    SELECT
+        c.id as client_id,
+        c.name as client_name,
+        c.email as client_email,
+        c.phone as client_phone,
+        c.address as client_address,
+        p.id as property_id,
+        p.category as property_category,
+        p.kind as property_kind,
+        p.address as property_address,
+        p.floor_area as property_floor_area,
+        p.rent_amount as property_rent_amount,
+        p.rent_period as property_rent_period,
+        r.start_date as rental_start_date,
+        r.end_date as rental_end_date,
+        r.payment_frequency as payment_frequency,
+        r.next_due_date as next_due_date,
+        CAST(julianday(r.next_due_date) - julianday('now', 'localtime', 'start of day') AS INTEGER)
+            as days_until_due,
+        r.status as rental_status
+    FROM clients c
+    LEFT JOIN rentals r ON c.id = r.client_id
+    LEFT JOIN properties p ON r.property_id = p.id
+    ORDER BY c.name, c.id, r.start_date DESC
+"""
+
+_SQL_CURRENT_RENTALS = f"""
+    SELECT p.*, {_SQL_PROPERTY_LABEL} AS property_name, c.name as client_name,
+        r.start_date, r.end_date, r.payment_frequency, r.next_due_date
+    FROM properties p
+    JOIN rentals r ON p.id = r.property_id
+    JOIN clients c ON r.client_id = c.id
+    WHERE p.is_available = 0 AND r.status = 'active'
+"""
+
+_SQL_DUE_PAYMENTS = f"""
+    SELECT r.*, c.name as client_name, p.address, p.rent_amount, p.kind,
+        {_SQL_PROPERTY_LABEL} AS property_name
+    FROM rentals r
+    JOIN clients c ON r.client_id = c.id
+    JOIN properties p ON r.property_id = p.id
+    WHERE r.next_due_date <= ? AND r.status = 'active'
+    ORDER BY r.next_due_date
+"""
+
+_SQL_AVAILABLE_PROPERTIES = f"SELECT p.*, {_SQL_PROPERTY_LABEL} AS property_name FROM properties p WHERE p.is_available=1"
 
 
 class Database:
     
-    def __init__(self, path=DB_FILE):
-        self.conn = sqlite3.connect(path)
+    def __init__(self, path=DB_FILE, check_same_thread=True):
+        # Autocommit mode: transactions are opened explicitly via transaction()
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=check_same_thread)
         self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            PRAGMA foreign_keys=ON;
+            """
+        )
+        # One long-lived cursor for execute()/query() and the save() paths
+        self._cursor = self.conn.cursor()
+        # Available properties keyed by id; None until first loaded
+        self._avail_cache = None
         self._create_tables()
         self._create_pictures_dir()
 
+    @property
+    def cursor(self):
+        return self._cursor
+
     def _create_pictures_dir(self):
         """Create directory for storing property pictures"""
         if not os.path.exists(PICTURES_DIR):
@@ -87,30 +181,143 @@ class Database:
                 FOREIGN KEY(client_id) REFERENCES clients(id),
                 FOREIGN KEY(property_id) REFERENCES properties(id)
             );
+
+            CREATE INDEX IF NOT EXISTS idx_payments_next_due ON payments(next_due);
+            CREATE INDEX IF NOT EXISTS idx_rentals_property_status ON rentals(property_id, status);
+            CREATE INDEX IF NOT EXISTS idx_rentals_client ON rentals(client_id);
+            CREATE INDEX IF NOT EXISTS idx_properties_category ON properties(category, is_available);
+            CREATE INDEX IF NOT EXISTS idx_rentals_due_active ON rentals(next_due_date) WHERE status = 'active';
+            CREATE INDEX IF NOT EXISTS idx_properties_available ON properties(is_available) WHERE is_available = 1;
             """
         )
-        self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed writes in a single transaction (one commit)"""
+        if self.conn.in_transaction:
+            # Nested use joins the outer transaction
+            yield self
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
 
     def execute(self, sql, params=()):
-        cur = self.conn.cursor()
-        cur.execute(sql, params)
-        self.conn.commit()
-        return cur
+        return self._cursor.execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self._cursor.executemany(sql, seq_of_params)
 
     def query(self, sql, params=()):
+        return self._cursor.execute(sql, params).fetchall()
+
+    def iter_query(self, sql, params=(), chunk_size=1000):
+        """Yield result rows in fetchmany() chunks instead of materializing them all"""
+        # Own cursor: the shared one may be reused while this generator is suspended
         cur = self.conn.cursor()
         cur.execute(sql, params)
-        return cur.fetchall()
+        while True:
+            chunk = cur.fetchmany(chunk_size)
+            if not chunk:
+                break
+            yield from chunk
+
+    def available_properties(self):
+        """Return the available properties, loading them once and reusing them afterwards"""
+        # Per-connection cache: writes through other pooled connections are not
+        # seen here, so renting re-checks is_available in the UPDATE itself
+        if self._avail_cache is None:
+            rows = self.query(_SQL_AVAILABLE_PROPERTIES)
+            self._avail_cache = {row['id']: row for row in rows}
+        return list(self._avail_cache.values())
+
+    def invalidate_available(self):
+        """Drop the available-properties cache so the next read reloads it"""
+        self._avail_cache = None
+
+    def mark_unavailable(self, property_id):
+        """Remove a single rented property from the cache without reloading it"""
+        if self._avail_cache is not None:
+            self._avail_cache.pop(property_id, None)
 
     def close(self):
         self.conn.close()
 
 
+class DatabasePool:
+    """Fixed set of long-lived Database connections shared between threads.
+
+    The CLI uses a single Database; a server front end would hand out
+    connections from here so WAL readers can run alongside a writer.
+    """
+    
+    def __init__(self, path=DB_FILE, size=4, timeout=5.0):
+        self.timeout = timeout
+        self._pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(Database(path, check_same_thread=False))
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a Database for the duration of the block"""
+        try:
+            db = self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("No database connection available") from None
+        try:
+            yield db
+        finally:
+            self._pool.put(db)
+
+    def close(self):
+        while True:
+            try:
+                db = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            db.close()
+
+
 class PictureManager:
     """Manages property picture uploads and storage"""
     
-    @staticmethod
-    def upload_picture(property_id: int, source_path: str) -> str:
+    # Property ID -> picture path, rebuilt whenever PICTURES_DIR changes
+    _cache: Dict[int, str] = {}
+    _cache_mtime: int = -1
+    
+    @classmethod
+    def _refresh_cache(cls):
+        """Rescan the pictures directory if it changed since the last scan"""
+        mtime = os.stat(PICTURES_DIR).st_mtime_ns
+        if mtime == cls._cache_mtime:
+            return
+        
+        cache = {}
+        with os.scandir(PICTURES_DIR) as entries:
+            for entry in entries:
+                # Files are named property_{id}.{ext}; is_file() is answered
+                # from the directory read on most platforms, no extra stat.
+                # isdigit() alone admits characters like '²' that int() rejects
+                stem, dot, _ = entry.name.partition('.')
+                digits = stem[9:]
+                if (dot and stem.startswith('property_') and digits.isascii() and digits.isdigit()
+                        and entry.is_file()):
+                    cache.setdefault(int(digits), entry.path)
+        cls._cache = cache
+        cls._cache_mtime = mtime
+    
+    @classmethod
+    def _mark_fresh(cls):
+        """Record our own change to the directory so it doesn't force a rescan"""
+        cls._cache_mtime = os.stat(PICTURES_DIR).st_mtime_ns
+    
+    @classmethod
+    def upload_picture(cls, property_id: int, source_path: str) -> str:
         """Upload a picture for a property"""
         if not os.path.exists(source_path):
             raise FileNotFoundError(f"Source file not found: {source_path}")
@@ -122,27 +329,36 @@ class PictureManager:
         new_filename = f"property_{property_id}{extension}"
         destination_path = os.path.join(PICTURES_DIR, new_filename)
         
-        # Copy file to pictures directory
-        shutil.copy2(source_path, destination_path)
+        # Bring the cache up to date before the copy changes the directory mtime
+        cls._refresh_cache()
+        
+        # Copy file contents only; the app never reads the copy's metadata
+        shutil.copyfile(source_path, destination_path)
+        
+        cls._cache[property_id] = destination_path
+        cls._mark_fresh()
         
         return destination_path
     
-    @staticmethod
-    def get_picture_path(property_id: int) -> Optional[str]:
+    @classmethod
+    def get_picture_path(cls, property_id: int) -> Optional[str]:
         """Get the picture path for a property"""
-        # Look for any file that starts with property_{id}
-        pattern = f"property_{property_id}."
-        for filename in os.listdir(PICTURES_DIR):
-            if filename.startswith(pattern):
-                return os.path.join(PICTURES_DIR, filename)
-        return None
+        cls._refresh_cache()
+        return cls._cache.get(property_id)
     
-    @staticmethod
-    def delete_picture(property_id: int):
+    @classmethod
+    def delete_picture(cls, property_id: int):
         """Delete picture for a property"""
-        picture_path = PictureManager.get_picture_path(property_id)
-        if picture_path and os.path.exists(picture_path):
-            os.remove(picture_path)
+        picture_path = cls.get_picture_path(property_id)
+        if picture_path:
+            try:
+                os.remove(picture_path)
+            except FileNotFoundError:
+                pass
+            # Drop the entry directly instead of relying on the directory mtime,
+            # which coarse-timestamp file systems may not bump
+            cls._cache.pop(property_id, None)
+            cls._mark_fresh()
     
     @staticmethod
     def list_supported_formats():
@@ -150,59 +366,73 @@ class PictureManager:
         return ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']
 
 
+# Category-specific display text. Each formatter takes a field getter, so the
+# same table serves Property objects and raw properties rows; missing counts show as 0
+_CATEGORY_FORMATTERS = {
+    'commercial': lambda get: "Commercial Property",
+    'residential': lambda get: f"Bedrooms: {get('bedrooms') or 0} | Bathrooms: {get('bathrooms') or 0}",
+    'land': lambda get: f"Land Use: {get('land_use')}",
+    'resorts': lambda get: f"Amenities: {get('amenities')}",
+    'venues': lambda get: f"Capacity: {get('capacity') or 0}",
+}
+
+
+@dataclass(slots=True, eq=False)
 class Person(ABC):
-    def __init__(self, name, email=None, phone=None):
-        self._name = name
-        self._email = email
-        self._phone = phone
+    name: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
 
     @abstractmethod
     def save(self, db: Database):
         pass
 
     def contact_info(self):
-        return f"{self._name} | Email: {self._email or 'N/A'} | Phone: {self._phone or 'N/A'}"
+        return f"{self.name} | Email: {self.email or 'N/A'} | Phone: {self.phone or 'N/A'}"
 
 
+@dataclass(slots=True, eq=False)
 class Client(Person):
-    def __init__(self, name, email=None, phone=None, address=None, notes=None, client_id=None):
-        super().__init__(name, email, phone)
-        self.address = address
-        self.notes = notes
-        self.id = client_id
+    address: Optional[str] = None
+    notes: Optional[str] = None
+    id: Optional[int] = None
 
     def save(self, db: Database):
         if self.id:
-            db.execute(
-                "UPDATE clients SET name=?, email=?, phone=?, address=?, notes=? WHERE id=?",
-                (self._name, self._email, self._phone, self.address, self.notes, self.id),
+            db.cursor.execute(
+                _SQL_UPDATE_CLIENT,
+                (self.name, self.email, self.phone, self.address, self.notes, self.id),
             )
         else:
-            cur = db.execute(
-                "INSERT INTO clients (name, email, phone, address, notes) VALUES (?, ?, ?, ?, ?)",
-                (self._name, self._email, self._phone, self.address, self.notes),
+            cur = db.cursor.execute(
+                _SQL_INSERT_CLIENT,
+                (self.name, self.email, self.phone, self.address, self.notes),
             )
             self.id = cur.lastrowid
         return self.id
 
 
+@dataclass(slots=True, eq=False)
 class Property(ABC):
     """Abstract base class for all properties"""
     
     RENT_PERIODS = ['monthly', 'yearly']
     
-    def __init__(self, category, kind, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True, prop_id=None):
-        self._category = category
-        self._kind = kind
-        self._address = address
-        self._floor_area = float(floor_area)
-        self._rent_amount = float(rent_amount)
-        self._rent_period = rent_period
-        self._picture_path = picture_path
-        self._description = description
-        self._is_available = is_available
-        self.id = prop_id
+    # Fixed by each subclass
+    category: str = field(init=False)
+    kind: Optional[str]
+    address: Optional[str] = None
+    floor_area: float = 0.0
+    rent_amount: float = 0.0
+    rent_period: str = "monthly"
+    picture_path: Optional[str] = None
+    description: str = ""
+    is_available: bool = True
+    id: Optional[int] = field(default=None, kw_only=True)
+
+    def __post_init__(self):
+        self.floor_area = float(self.floor_area)
+        self.rent_amount = float(self.rent_amount)
 
     @abstractmethod
     def get_specific_details(self) -> Dict:
@@ -210,40 +440,21 @@ class Property(ABC):
         pass
 
     def save(self, db: Database):
-        """Save property to database - common fields"""
-        specific_details = self.get_specific_details()
-        
-        avail = 1 if self._is_available else 0
+        """Save property to database - common and category-specific columns"""
+        # _INSERT_SQL/_UPDATE_SQL/_params are generated per subclass by _property_sql
+        params = self._params(self)
         if self.id:
-            db.execute(
-                """UPDATE properties SET category=?, kind=?, address=?, floor_area=?, rent_amount=?, 
-                rent_period=?, picture_path=?, description=?, is_available=?, bedrooms=?, 
-                bathrooms=?, land_use=?, amenities=?, capacity=? WHERE id=?""",
-                (self._category, self._kind, self._address, self._floor_area, self._rent_amount, 
-                 self._rent_period, self._picture_path, self._description, avail,
-                 specific_details.get('bedrooms'), specific_details.get('bathrooms'), 
-                 specific_details.get('land_use'), specific_details.get('amenities'), 
-                 specific_details.get('capacity'), self.id),
-            )
+            db.cursor.execute(self._UPDATE_SQL, params + (self.id,))
         else:
-            cur = db.execute(
-                """INSERT INTO properties (category, kind, address, floor_area, rent_amount, 
-                rent_period, picture_path, description, is_available, bedrooms, bathrooms, 
-                land_use, amenities, capacity) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (self._category, self._kind, self._address, self._floor_area, self._rent_amount, 
-                 self._rent_period, self._picture_path, self._description, avail,
-                 specific_details.get('bedrooms'), specific_details.get('bathrooms'),
-                 specific_details.get('land_use'), specific_details.get('amenities'), 
-                 specific_details.get('capacity')),
-            )
+            cur = db.cursor.execute(self._INSERT_SQL, params)
             self.id = cur.lastrowid
         return self.id
 
     def display_info(self):
-        base_info = f"ID: {self.id} | Category: {self._category.title()} | Kind: {self._kind or 'N/A'} | " \
-                   f"Address: {self._address} | Floor Area: {self._floor_area} sqm | " \
-                   f"Rent: ₱{self._rent_amount}/{self._rent_period} | " \
-                   f"Available: {'Yes' if self._is_available else 'No'}"
+        base_info = f"ID: {self.id} | Category: {self.category.title()} | Kind: {self.kind or 'N/A'} | " \
+                   f"Address: {self.address} | Floor Area: {self.floor_area} sqm | " \
+                   f"Rent: ₱{self.rent_amount}/{self.rent_period} | " \
+                   f"Available: {'Yes' if self.is_available else 'No'}"
         
         specific_info = self._get_specific_display_info()
         if specific_info:
@@ -253,25 +464,15 @@ class Property(ABC):
 
     def _get_specific_display_info(self) -> str:
         """Get category-specific display information"""
-        details = self.get_specific_details()
-        if self._category == 'commercial':
-            return "Commercial Property"
-        elif self._category == 'residential':
-            return f"Bedrooms: {details.get('bedrooms', 0)} | Bathrooms: {details.get('bathrooms', 0)}"
-        elif self._category == 'land':
-            return f"Land Use: {details.get('land_use', 'N/A')}"
-        elif self._category == 'resorts':
-            return f"Amenities: {details.get('amenities', 'N/A')}"
-        elif self._category == 'venues':
-            return f"Capacity: {details.get('capacity', 0)}"
-        return ""
+        formatter = _CATEGORY_FORMATTERS.get(self.category)
+        return formatter(lambda name: getattr(self, name)) if formatter else ""
 
     def upload_picture(self, source_path: str):
         """Upload picture for this property"""
         if self.id:
             try:
                 new_path = PictureManager.upload_picture(self.id, source_path)
-                self._picture_path = new_path
+                self.picture_path = new_path
                 return True
             except Exception as e:
                 print(f"Error uploading picture: {e}")
@@ -280,82 +481,95 @@ class Property(ABC):
 
     def get_picture_info(self):
         """Get picture information"""
-        if self._picture_path and os.path.exists(self._picture_path):
-            return f"Picture: {os.path.basename(self._picture_path)}"
-        elif PictureManager.get_picture_path(self.id):
-            picture_path = PictureManager.get_picture_path(self.id)
-            self._picture_path = picture_path
+        if self.picture_path and os.path.exists(self.picture_path):
+            return f"Picture: {os.path.basename(self.picture_path)}"
+
+        picture_path = PictureManager.get_picture_path(self.id)
+        if picture_path:
+            self.picture_path = picture_path
             return f"Picture: {os.path.basename(picture_path)}"
-        else:
-            return "No picture available"
+        return "No picture available"
+
 
+# Columns every property row stores; subclasses add their own
+_PROPERTY_COLUMNS = ('category', 'kind', 'address', 'floor_area', 'rent_amount',
+                     'rent_period', 'picture_path', 'description', 'is_available')
 
+
+def _property_sql(*extra_columns):
+    """Class decorator: generate the INSERT/UPDATE statements and parameter
+    getter for a Property subclass, covering only the columns it uses"""
+    columns = _PROPERTY_COLUMNS + extra_columns
+
+    def decorate(cls):
+        cls._INSERT_SQL = (f"INSERT INTO properties ({', '.join(columns)}) "
+                           f"VALUES ({', '.join('?' * len(columns))})")
+        cls._UPDATE_SQL = f"UPDATE properties SET {'=?, '.join(columns)}=? WHERE id=?"
+        cls._params = attrgetter(*columns)
+        return cls
+    return decorate
+
+
+@_property_sql()
+@dataclass(slots=True, eq=False)
 class CommercialProperty(Property):
-    def __init__(self, kind, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True, prop_id=None):
-        super().__init__('commercial', kind, address, floor_area, rent_amount,
-                        rent_period, picture_path, description, is_available, prop_id)
+    category: str = field(default='commercial', init=False)
 
     def get_specific_details(self) -> Dict:
         return {}
 
 
+@_property_sql('bedrooms', 'bathrooms')
+@dataclass(slots=True, eq=False)
 class ResidentialProperty(Property):
-    def __init__(self, kind, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True,
-                 bedrooms=0, bathrooms=0, prop_id=None):
-        super().__init__('residential', kind, address, floor_area, rent_amount,
-                        rent_period, picture_path, description, is_available, prop_id)
-        self._bedrooms = bedrooms
-        self._bathrooms = bathrooms
+    category: str = field(default='residential', init=False)
+    bedrooms: int = 0
+    bathrooms: int = 0
 
     def get_specific_details(self) -> Dict:
         return {
-            'bedrooms': self._bedrooms,
-            'bathrooms': self._bathrooms
+            'bedrooms': self.bedrooms,
+            'bathrooms': self.bathrooms
         }
 
 
+@_property_sql('land_use')
+@dataclass(slots=True, eq=False)
 class LandProperty(Property):
-    def __init__(self, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True,
-                 land_use=None, prop_id=None):
-        # For land properties, we don't use 'kind', so we pass None
-        super().__init__('land', None, address, floor_area, rent_amount,
-                        rent_period, picture_path, description, is_available, prop_id)
-        self._land_use = land_use
+    category: str = field(default='land', init=False)
+    # For land properties, we don't use 'kind'
+    kind: Optional[str] = field(default=None, init=False)
+    land_use: Optional[str] = None
 
     def get_specific_details(self) -> Dict:
-        return {'land_use': self._land_use}
+        return {'land_use': self.land_use}
 
 
+@_property_sql('amenities')
+@dataclass(slots=True, eq=False)
 class ResortProperty(Property):
-    def __init__(self, kind, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True,
-                 amenities=None, prop_id=None):
-        super().__init__('resorts', kind, address, floor_area, rent_amount,
-                        rent_period, picture_path, description, is_available, prop_id)
-        self._amenities = amenities
+    category: str = field(default='resorts', init=False)
+    amenities: Optional[str] = None
 
     def get_specific_details(self) -> Dict:
-        return {'amenities': self._amenities}
+        return {'amenities': self.amenities}
 
 
+@_property_sql('capacity')
+@dataclass(slots=True, eq=False)
 class VenueProperty(Property):
-    def __init__(self, kind, address=None, floor_area=0.0, rent_amount=0.0,
-                 rent_period="monthly", picture_path=None, description="", is_available=True,
-                 capacity=0, prop_id=None):
-        super().__init__('venues', kind, address, floor_area, rent_amount,
-                        rent_period, picture_path, description, is_available, prop_id)
-        self._capacity = capacity
+    category: str = field(default='venues', init=False)
+    capacity: int = 0
 
     def get_specific_details(self) -> Dict:
-        return {'capacity': self._capacity}
+        return {'capacity': self.capacity}
 
 
 class Rental:
-    PAYMENT_METHODS = ['cash', 'credit_card', 'bank_transfer', 'check']
-    PAYMENT_FREQUENCIES = ['monthly', 'yearly']
+    # Display order for prompts; the frozensets below serve membership checks
+    PAYMENT_METHOD_CHOICES = ('cash', 'credit_card', 'bank_transfer', 'check')
+    PAYMENT_METHODS = frozenset(PAYMENT_METHOD_CHOICES)
+    PAYMENT_FREQUENCIES = frozenset({'monthly', 'yearly'})
     
     def __init__(self, client_id, property_id, start_date, end_date, duration_months, 
                  total_amount, payment_method, payment_frequency, next_due_date, status='active', rental_id=None):
@@ -373,19 +587,15 @@ class Rental:
 
     def save(self, db: Database):
         if self.id:
-            db.execute(
-                """UPDATE rentals SET client_id=?, property_id=?, start_date=?, end_date=?, 
-                duration_months=?, total_amount=?, payment_method=?, payment_frequency=?, 
-                next_due_date=?, status=? WHERE id=?""",
+            db.cursor.execute(
+                _SQL_UPDATE_RENTAL,
                 (self.client_id, self.property_id, self.start_date, self.end_date,
                  self.duration_months, self.total_amount, self.payment_method, 
                  self.payment_frequency, self.next_due_date, self.status, self.id),
             )
         else:
-            cur = db.execute(
-                """INSERT INTO rentals (client_id, property_id, start_date, end_date, 
-                duration_months, total_amount, payment_method, payment_frequency, next_due_date, status) 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            cur = db.cursor.execute(
+                _SQL_INSERT_RENTAL,
                 (self.client_id, self.property_id, self.start_date, self.end_date,
                  self.duration_months, self.total_amount, self.payment_method, 
                  self.payment_frequency, self.next_due_date, self.status),
@@ -410,121 +620,167 @@ def input_int(prompt):
             print("Invalid input. Enter a valid number.")
 
 
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_YES = frozenset({"yes", "y"})
+_NO = frozenset({"no", "n"})
+
+
 def input_date(prompt):
     while True:
-        date = input(prompt)
-        if not date:
+        value = input(prompt)
+        if not value:
             return None
-        try:
-            datetime.strptime(date, DATE_FMT)
-            return date
-        except ValueError:
-            print("Invalid date format. Use YYYY-MM-DD.")
+        match = _DATE_RE.match(value)
+        if match:
+            # The regex checks the shape; date() rejects impossible days (e.g. Feb 30)
+            try:
+                return date(*map(int, match.groups()))
+            except ValueError:
+                pass
+        print("Invalid date format. Use YYYY-MM-DD.")
 
 
 def input_yes_no(prompt):
     while True:
         ans = input(prompt).lower()
-        if ans in ["yes", "y"]:
+        if ans in _YES:
             return True
-        elif ans in ["no", "n"]:
+        elif ans in _NO:
             return False
         print("Enter yes or no only.")
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _add_months(date_str: str, months: int) -> str:
+    """Add whole months to a YYYY-MM-DD string using integer math only"""
+    year, month, day = int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+    # Clamp to the end of shorter months (e.g. Jan 31 -> Feb 28/29)
+    day = min(day, _days_in_month(year, month))
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=1024)
 def calculate_next_due_date(start_date: str, payment_frequency: str) -> str:
     """Calculate next due date based on start date and payment frequency"""
-    start_date_obj = datetime.strptime(start_date, DATE_FMT)
-    
     if payment_frequency == "monthly":
-        # Add one month to start date
-        next_month = start_date_obj.month + 1
-        year = start_date_obj.year
-        if next_month > 12:
-            next_month = 1
-            year += 1
-        next_due = datetime(year, next_month, start_date_obj.day)
-    else:  # yearly
-        # Add one year to start date
-        next_due = datetime(start_date_obj.year + 1, start_date_obj.month, start_date_obj.day)
-    
-    return next_due.strftime(DATE_FMT)
+        return _add_months(start_date, 1)
+    return _add_months(start_date, 12)  # yearly
 
 
 def next_due_date(paid_on_str: str, frequency: str):
-    paid = datetime.strptime(paid_on_str, DATE_FMT)
     if frequency == "monthly":
-        month = paid.month + 1
-        year = paid.year + (month > 12)
-        month = 1 if month > 12 else month
-        return datetime(year, month, paid.day).strftime(DATE_FMT)
+        return _add_months(paid_on_str, 1)
     elif frequency == "annual":
-        return datetime(paid.year + 1, paid.month, paid.day).strftime(DATE_FMT)
+        return _add_months(paid_on_str, 12)
 
 
 def record_payment(db: Database, client_id, property_id, amount, paid_on, freq, notes=None):
     nd = next_due_date(paid_on, freq)
-    db.execute(
-        "INSERT INTO payments (client_id,property_id,amount,paid_on,frequency,next_due,notes) VALUES (?,?,?,?,?,?,?)",
-        (client_id, property_id, amount, paid_on, freq, nd, notes),
-    )
+    with db.transaction():
+        db.execute(
+            "INSERT INTO payments (client_id,property_id,amount,paid_on,frequency,next_due,notes) VALUES (?,?,?,?,?,?,?)",
+            (client_id, property_id, amount, paid_on, freq, nd, notes),
+        )
     print(f"Payment saved. Next due date: {nd}")
 
 
 def check_due_payments(db: Database):
     today = datetime.today().strftime(DATE_FMT)
-    rows = db.query(
+    rows = db.iter_query(
         "SELECT p.id,c.name,p.amount,p.next_due,p.frequency "
         "FROM payments p JOIN clients c ON p.client_id=c.id "
         "WHERE p.next_due<=?",
         (today,),
     )
-    if not rows:
+    first = next(rows, None)
+    if first is None:
         print("No due payments.")
         return
     print("\nDue or Past Due Payments:")
-    for r in rows:
+    # Totals are accumulated in the same pass that prints the rows
+    total_due = 0.0
+    count = 0
+    for r in itertools.chain((first,), rows):
+        total_due += r['amount']
+        count += 1
         print(f"Client: {r['name']} | Amount: ₱{r['amount']} | Due: {r['next_due']} | {r['frequency']}")
+    print(f"Total Due: ₱{total_due:.2f} across {count} payment(s)")
+
+
+# Positional constructor arguments for each Property subclass, taken from a
+# properties row (id is keyword-only and passed separately)
+def _common_args(r):
+    return (r['address'], r['floor_area'], r['rent_amount'], r['rent_period'],
+            r['picture_path'], r['description'], True)
+
+
+def _commercial_args(r):
+    return (r['kind'], *_common_args(r))
+
+
+def _residential_args(r):
+    return (r['kind'], *_common_args(r), r['bedrooms'] or 0, r['bathrooms'] or 0)
+
+
+def _land_args(r):
+    return (*_common_args(r), r['land_use'])
+
+
+def _resort_args(r):
+    return (r['kind'], *_common_args(r), r['amenities'])
+
+
+def _venue_args(r):
+    return (r['kind'], *_common_args(r), r['capacity'] or 0)
+
+
+_CATEGORY_CTORS = {
+    'commercial': (CommercialProperty, _commercial_args),
+    'residential': (ResidentialProperty, _residential_args),
+    'land': (LandProperty, _land_args),
+    'resorts': (ResortProperty, _resort_args),
+    'venues': (VenueProperty, _venue_args),
+}
 
 
 def print_properties(props):
-    if not props:
+    # props may be a list or a streaming iterator from Database.iter_query
+    rows = iter(props)
+    first = next(rows, None)
+    if first is None:
         print("No properties found.")
         return
 
     print("\nProperties:")
     print("-" * 120)
-    for r in props:
-        # Create appropriate property object based on category
-        category = r['category']
-        if category == 'commercial':
-            prop = CommercialProperty(r['kind'], r['address'], r['floor_area'], r['rent_amount'],
-                                    r['rent_period'], r['picture_path'], r['description'], bool(r['is_available']),
-                                    r['id'])
-        elif category == 'residential':
-            prop = ResidentialProperty(r['kind'], r['address'], r['floor_area'], r['rent_amount'],
-                                     r['rent_period'], r['picture_path'], r['description'], bool(r['is_available']),
-                                     r['bedrooms'] or 0, r['bathrooms'] or 0, r['id'])
-        elif category == 'land':
-            prop = LandProperty(r['address'], r['floor_area'], r['rent_amount'],
-                              r['rent_period'], r['picture_path'], r['description'], bool(r['is_available']),
-                              r['land_use'], r['id'])
-        elif category == 'resorts':
-            prop = ResortProperty(r['kind'], r['address'], r['floor_area'], r['rent_amount'],
-                                r['rent_period'], r['picture_path'], r['description'], bool(r['is_available']),
-                                r['amenities'], r['id'])
-        elif category == 'venues':
-            prop = VenueProperty(r['kind'], r['address'], r['floor_area'], r['rent_amount'],
-                               r['rent_period'], r['picture_path'], r['description'], bool(r['is_available']),
-                               r['capacity'] or 0, r['id'])
-        else:
+    for r in itertools.chain((first,), rows):
+        formatter = _CATEGORY_FORMATTERS.get(r['category'])
+        if formatter is None:
             continue
-            
-        print(prop.display_info())
-        print(prop.get_picture_info())
+        
+        picture_path = PictureManager.get_picture_path(r['id'])
+        # One write per row keeps output streaming while rows are still being fetched
+        out = [
+            f"ID: {r['id']} | Category: {r['category'].title()} | Kind: {r['kind'] or 'N/A'} | "
+            f"Address: {r['address']} | Floor Area: {r['floor_area']} sqm | "
+            f"Rent: ₱{r['rent_amount']}/{r['rent_period']} | "
+            f"Available: {'Yes' if r['is_available'] else 'No'} | {formatter(r.__getitem__)}",
+            f"Picture: {os.path.basename(picture_path)}" if picture_path else "No picture available",
+        ]
         if r['description']:
-            print(f"Description: {r['description']}")
-        print("-" * 80)
+            out.append(f"Description: {r['description']}")
+        out.append("-" * 80)
+        sys.stdout.write("\n".join(out) + "\n")
     print("-" * 120)
 
 
@@ -603,14 +859,21 @@ def delete_property_interactive(db: Database):
         confirm = input_yes_no("\nAre you sure you want to delete this property? This action cannot be undone! (yes/no): ")
         
         if confirm:
-            # Delete associated picture
-            PictureManager.delete_picture(property_id)
+            try:
+                with db.transaction():
+                    # Delete associated payments first (foreign keys are enforced)
+                    db.execute("DELETE FROM payments WHERE property_id = ?", (property_id,))
+                    
+                    # Delete property from database
+                    db.execute("DELETE FROM properties WHERE id = ?", (property_id,))
+            except sqlite3.IntegrityError:
+                print("Cannot delete property that still has rental records!")
+                return
             
-            # Delete property from database
-            db.execute("DELETE FROM properties WHERE id = ?", (property_id,))
+            db.invalidate_available()
             
-            # Delete associated payments
-            db.execute("DELETE FROM payments WHERE property_id = ?", (property_id,))
+            # Delete associated picture once the rows are gone
+            PictureManager.delete_picture(property_id)
             
             print(f"Property with ID {property_id} has been deleted successfully.")
         else:
@@ -625,11 +888,10 @@ def add_property_interactive(db: Database):
     print("\n=== Add New Property ===")
     
     # Get category
-    categories = ['commercial', 'residential', 'land', 'resorts', 'venues']
-    print("Available categories: commercial, residential, land, resorts, venues")
+    print("Available categories:", ", ".join(CATEGORIES))
     
     category = input("Enter category: ").strip().lower()
-    if category not in categories:
+    if category not in CATEGORIES:
         print("Invalid category!")
         return
     
@@ -686,8 +948,11 @@ def add_property_interactive(db: Database):
         prop = VenueProperty(kind, address, floor_area, rent_amount, rent_period,
                            None, description, True, capacity)
     
-    # Save property first to get ID
-    prop.save(db)
+    # Commit the insert before prompting; no transaction stays open across input or file I/O
+    with db.transaction():
+        # Save property first to get ID
+        prop.save(db)
+    db.invalidate_available()
     print(f"Property added successfully with ID: {prop.id}")
     
     # Ask about picture upload
@@ -696,8 +961,10 @@ def add_property_interactive(db: Database):
         picture_path = upload_picture_interactive(prop.id)
         if picture_path:
             # Update property with picture path
-            prop._picture_path = picture_path
-            prop.save(db)
+            prop.picture_path = picture_path
+            with db.transaction():
+                prop.save(db)
+            db.invalidate_available()
             print("Picture linked to property successfully!")
         else:
             print("Picture upload failed or was cancelled.")
@@ -707,60 +974,35 @@ def display_clients_with_rentals(db: Database):
     """Display all clients with their rental and property information"""
     print("\n=== All Clients with Rentals ===")
     
-    query = """
-        SELECT 
-            c.id as client_id, 
-            c.name as client_name, 
-            c.email as client_email, 
-            c.phone as client_phone, 
-            c.address as client_address, 
-            c.notes as client_notes,
-            p.id as property_id, 
-            p.category as property_category,
-            p.kind as property_kind, 
-            p.address as property_address, 
-            p.floor_area as property_floor_area,
-            p.rent_amount as property_rent_amount, 
-            p.rent_period as property_rent_period,
-            p.description as property_description,
-            r.start_date as rental_start_date,
-            r.end_date as rental_end_date, 
-            r.payment_frequency as payment_frequency,
-            r.next_due_date as next_due_date,
-            r.status as rental_status
-        FROM clients c
-        LEFT JOIN rentals r ON c.id = r.client_id
-        LEFT JOIN properties p ON r.property_id = p.id
-        ORDER BY c.name
-    """
-    
-    rows = db.query(query)
+    rows = db.query(_SQL_CLIENTS_WITH_RENTALS)
     
     if not rows:
         print("No clients found.")
         return
     
-    current_client = None
-    for row in rows:
-        client_id = row['client_id']
-        
-        if current_client != client_id:
-            if current_client is not None:
-                print()
-            current_client = client_id
-            print(f"Client: {row['client_name']} | Email: {row['client_email'] or 'N/A'} | Address: {row['client_address'] or 'N/A'}")
-            if row['client_phone']:
-                print(f"Phone: {row['client_phone']}")
+    out = []
+    # Rows arrive contiguous per client, so group them without a lookup table
+    for i, (client_id, group) in enumerate(itertools.groupby(rows, key=lambda r: r['client_id'])):
+        group = list(group)
+        client = group[0]
+        if i:
+            out.append("")
+        out.append(f"Client: {client['client_name']} | Email: {client['client_email'] or 'N/A'} | Address: {client['client_address'] or 'N/A'}")
+        if client['client_phone']:
+            out.append(f"Phone: {client['client_phone']}")
         
-        # Check if client has rentals (property_id will be None if no rentals)
-        if row['property_id'] is not None:  
-            print(f"  - Rented Property: {row['property_kind'] or 'Land'} in {row['property_address']}")
-            print(f"    Category: {row['property_category']} | Floor Area: {row['property_floor_area']} sqm")
-            print(f"    Rent: ₱{row['property_rent_amount']}/{row['property_rent_period']}")
-            print(f"    Rental Period: {row['rental_start_date']} to {row['rental_end_date']}")
-            print(f"    Payment Frequency: {row['payment_frequency']}")
-            print(f"    Next Due Date: {row['next_due_date']}")
-            print(f"    Status: {row['rental_status']}")
+        for row in group:
+            # Client has no rentals when property_id is None (LEFT JOIN)
+            if row['property_id'] is None:
+                continue
+            out.append(f"  - Rented Property: {row['property_kind'] or 'Land'} in {row['property_address']}")
+            out.append(f"    Category: {row['property_category']} | Floor Area: {row['property_floor_area']} sqm")
+            out.append(f"    Rent: ₱{row['property_rent_amount']}/{row['property_rent_period']}")
+            out.append(f"    Rental Period: {row['rental_start_date']} to {row['rental_end_date']}")
+            out.append(f"    Payment Frequency: {row['payment_frequency']}")
+            out.append(f"    Next Due Date: {row['next_due_date']} (in {row['days_until_due']} days)")
+            out.append(f"    Status: {row['rental_status']}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def rent_property_interactive(db: Database):
@@ -768,7 +1010,7 @@ def rent_property_interactive(db: Database):
     print("\n=== Rent a Property ===")
     
     # Display available properties
-    available_props = db.query("SELECT * FROM properties WHERE is_available=1")
+    available_props = db.available_properties()
     
     if not available_props:
         print("No available properties found.")
@@ -777,8 +1019,7 @@ def rent_property_interactive(db: Database):
     print("\nAvailable Properties:")
     print("-" * 80)
     for i, prop in enumerate(available_props, 1):
-        property_name = f"{prop['kind'] or 'Land'} in {prop['address']}"
-        print(f"{i}. {property_name} - ₱{prop['rent_amount']}/{prop['rent_period']}")
+        print(f"{i}. {prop['property_name']} - ₱{prop['rent_amount']}/{prop['rent_period']}")
     print("-" * 80)
     
     # Select property
@@ -795,31 +1036,8 @@ def rent_property_interactive(db: Database):
     print(f"\nSelected Property:")
     
     # Display property details based on category
-    if selected_prop['category'] == 'commercial':
-        prop_obj = CommercialProperty(selected_prop['kind'], selected_prop['address'], 
-                                    selected_prop['floor_area'], selected_prop['rent_amount'],
-                                    selected_prop['rent_period'], selected_prop['picture_path'],
-                                    selected_prop['description'], True, selected_prop['id'])
-    elif selected_prop['category'] == 'residential':
-        prop_obj = ResidentialProperty(selected_prop['kind'], selected_prop['address'], 
-                                     selected_prop['floor_area'], selected_prop['rent_amount'],
-                                     selected_prop['rent_period'], selected_prop['picture_path'],
-                                     selected_prop['description'], True, selected_prop['bedrooms'] or 0, 
-                                     selected_prop['bathrooms'] or 0, selected_prop['id'])
-    elif selected_prop['category'] == 'land':
-        prop_obj = LandProperty(selected_prop['address'], selected_prop['floor_area'], selected_prop['rent_amount'],
-                              selected_prop['rent_period'], selected_prop['picture_path'],
-                              selected_prop['description'], True, selected_prop['land_use'], selected_prop['id'])
-    elif selected_prop['category'] == 'resorts':
-        prop_obj = ResortProperty(selected_prop['kind'], selected_prop['address'], 
-                                selected_prop['floor_area'], selected_prop['rent_amount'],
-                                selected_prop['rent_period'], selected_prop['picture_path'],
-                                selected_prop['description'], True, selected_prop['amenities'], selected_prop['id'])
-    elif selected_prop['category'] == 'venues':
-        prop_obj = VenueProperty(selected_prop['kind'], selected_prop['address'], 
-                               selected_prop['floor_area'], selected_prop['rent_amount'],
-                               selected_prop['rent_period'], selected_prop['picture_path'],
-                               selected_prop['description'], True, selected_prop['capacity'] or 0, selected_prop['id'])
+    cls, extract_args = _CATEGORY_CTORS[selected_prop['category']]
+    prop_obj = cls(*extract_args(selected_prop), id=selected_prop['id'])
     
     print(prop_obj.display_info())
     print(prop_obj.get_picture_info())
@@ -833,9 +1051,8 @@ def rent_property_interactive(db: Database):
     address = input("Enter client address: ").strip()
     phone = input("Enter client phone (optional): ").strip()
     
-    # Create client
+    # Create client (saved together with the rental once confirmed)
     client = Client(name, email, phone, address)
-    client.save(db)
     
     # Get rental dates
     print("\nRental Period Information:")
@@ -850,33 +1067,27 @@ def rent_property_interactive(db: Database):
         return
     
     # Validate dates
-    start_date_obj = datetime.strptime(start_date, DATE_FMT)
-    end_date_obj = datetime.strptime(end_date, DATE_FMT)
-    
-    if start_date_obj >= end_date_obj:
+    if start_date >= end_date:
         print("End date must be after start date!")
         return
     
-    # Calculate duration in months
-    duration_months = (end_date_obj.year - start_date_obj.year) * 12 + (end_date_obj.month - start_date_obj.month)
-    if end_date_obj.day > start_date_obj.day:
-        duration_months += 1
+    # Calculate duration in months; a partial trailing month counts as a full one
+    duration_months = ((end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+                       + (end_date.day > start_date.day))
     
     if duration_months <= 0:
         print("Rental duration must be at least 1 month!")
         return
     
     # Calculate total amount
-    if selected_prop['rent_period'] == 'monthly':
-        total_amount = selected_prop['rent_amount'] * duration_months
-    else:  # yearly
-        total_amount = (selected_prop['rent_amount'] / 12) * duration_months
+    rent_amount = selected_prop['rent_amount']
+    rate_per_month = rent_amount if selected_prop['rent_period'] == 'monthly' else rent_amount / 12
+    total_amount = rate_per_month * duration_months
     
     # Get payment method
-    payment_methods = Rental.PAYMENT_METHODS
-    print("Payment methods:", ", ".join(payment_methods))
+    print("Payment methods:", ", ".join(Rental.PAYMENT_METHOD_CHOICES))
     payment_method = input("Enter payment method: ").strip().lower()
-    if payment_method not in payment_methods:
+    if payment_method not in Rental.PAYMENT_METHODS:
         print("Invalid payment method!")
         return
     
@@ -888,7 +1099,7 @@ def rent_property_interactive(db: Database):
         return
     
     # Calculate next due date based on start date and payment frequency
-    next_due_date = calculate_next_due_date(start_date, payment_frequency)
+    next_due_date = calculate_next_due_date(start_date.isoformat(), payment_frequency)
     
     # Confirm rental
     print(f"\nRental Summary:")
@@ -900,13 +1111,25 @@ def rent_property_interactive(db: Database):
     confirm = input("\nConfirm rental? (yes/no): ").strip().lower()
     
     if confirm == 'yes':
-        # Create rental
-        rental = Rental(client.id, selected_prop['id'], start_date, end_date,
-                      duration_months, total_amount, payment_method, payment_frequency, next_due_date)
-        rental.save(db)
+        # Client, rental and availability flag are written in one transaction
+        with db.transaction():
+            # Claim the property first: the listing may be stale if another
+            # connection rented it in the meantime
+            claimed = db.execute("UPDATE properties SET is_available=0 WHERE id=? AND is_available=1",
+                                 (selected_prop['id'],)).rowcount
+            if claimed:
+                client.save(db)
+                
+                # Create rental
+                rental = Rental(client.id, selected_prop['id'], start_date.isoformat(), end_date.isoformat(),
+                              duration_months, total_amount, payment_method, payment_frequency, next_due_date)
+                rental.save(db)
         
-        # Update property availability
-        db.execute("UPDATE properties SET is_available=0 WHERE id=?", (selected_prop['id'],))
+        if not claimed:
+            db.invalidate_available()
+            print("This property is no longer available. Rental cancelled.")
+            return
+        db.mark_unavailable(selected_prop['id'])
         
         print("Property rented successfully!")
     else:
@@ -917,70 +1140,55 @@ def display_rentals(db: Database):
     """Display currently rented properties"""
     print("\n=== Currently Rented Properties ===")
     
-    query = """
-        SELECT p.*, c.name as client_name, r.start_date, r.end_date, r.payment_frequency, r.next_due_date
-        FROM properties p
-        JOIN rentals r ON p.id = r.property_id
-        JOIN clients c ON r.client_id = c.id
-        WHERE p.is_available = 0 AND r.status = 'active'
-    """
-    
-    rows = db.query(query)
+    rows = db.query(_SQL_CURRENT_RENTALS)
     
     if not rows:
         print("No currently rented properties.")
         return
     
+    today = date.today()
+    out = []
     for row in rows:
-        property_name = f"{row['kind'] or 'Land'} in {row['address']}"
-        print(f"Property: {property_name}")
-        print(f"Category: {row['category']} | Floor Area: {row['floor_area']} sqm")
-        print(f"Rent: ₱{row['rent_amount']}/{row['rent_period']}")
-        print(f"Rented by: {row['client_name']}")
-        print(f"Rental Period: {row['start_date']} to {row['end_date']}")
-        print(f"Payment Frequency: {row['payment_frequency']}")
-        print(f"Next Due Date: {row['next_due_date']}")
+        out.append(f"Property: {row['property_name']}")
+        out.append(f"Category: {row['category']} | Floor Area: {row['floor_area']} sqm")
+        out.append(f"Rent: ₱{row['rent_amount']}/{row['rent_period']}")
+        out.append(f"Rented by: {row['client_name']}")
+        out.append(f"Rental Period: {row['start_date']} to {row['end_date']}")
+        out.append(f"Payment Frequency: {row['payment_frequency']}")
+        out.append(f"Next Due Date: {row['next_due_date']}")
         
-        end_date_obj = datetime.strptime(row['end_date'], DATE_FMT)
-        remaining_days = (end_date_obj - datetime.today()).days
-        print(f"Remaining Days: {remaining_days}")
-        print("-" * 60)
+        remaining_days = (date.fromisoformat(row['end_date']) - today).days
+        out.append(f"Remaining Days: {remaining_days}")
+        out.append("-" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def display_due_payments(db: Database):
     """Display rentals due in 1 month or less"""
     print("\n=== Due Payments (Within 1 Month) ===")
     
-    one_month_later = (datetime.today() + timedelta(days=30)).strftime(DATE_FMT)
+    today = date.today()
+    one_month_later = (today + timedelta(days=30)).isoformat()
     
-    query = """
-        SELECT r.*, c.name as client_name, p.address, p.rent_amount, p.kind
-        FROM rentals r
-        JOIN clients c ON r.client_id = c.id
-        JOIN properties p ON r.property_id = p.id
-        WHERE r.next_due_date <= ? AND r.status = 'active'
-        ORDER BY r.next_due_date
-    """
-    
-    rows = db.query(query, (one_month_later,))
+    rows = db.query(_SQL_DUE_PAYMENTS, (one_month_later,))
     
     if not rows:
         print("No due payments in the next month.")
         return
     
+    out = []
     for row in rows:
-        next_due_obj = datetime.strptime(row['next_due_date'], DATE_FMT)
-        days_remaining = (next_due_obj - datetime.today()).days
+        days_remaining = (date.fromisoformat(row['next_due_date']) - today).days
         
-        print(f"Rental ID: {row['id']}")
-        print(f"Client: {row['client_name']}")
-        property_name = f"{row['kind'] or 'Land'} in {row['address']}"
-        print(f"Property: {property_name}")
-        print(f"Next Due Date: {row['next_due_date']} (in {days_remaining} days)")
-        print(f"Total Amount: ₱{row['total_amount']:.2f}")
-        print(f"Payment Method: {row['payment_method']}")
-        print(f"Payment Frequency: {row['payment_frequency']}")
-        print("-" * 60)
+        out.append(f"Rental ID: {row['id']}")
+        out.append(f"Client: {row['client_name']}")
+        out.append(f"Property: {row['property_name']}")
+        out.append(f"Next Due Date: {row['next_due_date']} (in {days_remaining} days)")
+        out.append(f"Total Amount: ₱{row['total_amount']:.2f}")
+        out.append(f"Payment Method: {row['payment_method']}")
+        out.append(f"Payment Frequency: {row['payment_frequency']}")
+        out.append("-" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def menu():
@@ -1012,15 +1220,22 @@ def menu():
                     sub_choice = input("Choose option: ")
                     
                     if sub_choice == "1":
-                        props = db.query("SELECT * FROM properties ORDER BY category, kind")
+                        print("Categories:", ", ".join(CATEGORIES))
+                        category = input("Category (or Enter for all): ").strip().lower()
+                        if category in CATEGORIES:
+                            props = db.iter_query("SELECT * FROM properties WHERE category=? ORDER BY kind",
+                                                  (category,))
+                        else:
+                            if category:
+                                print("Unknown category, showing all properties.")
+                            props = db.iter_query("SELECT * FROM properties ORDER BY category, kind")
                         print_properties(props)
                     
                     elif sub_choice == "2":
                         add_property_interactive(db)
                     
                     elif sub_choice == "3":
-                        props = db.query("SELECT * FROM properties WHERE is_available=1")
-                        print_properties(props)
+                        print_properties(db.available_properties())
                     
                     elif sub_choice == "4":
                         delete_property_interactive(db)
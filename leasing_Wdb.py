@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import re
+import sys
+from datetime import date, datetime, timedelta
 
 # -----------------------------
 #        DATA STORAGE
@@ -6,11 +8,14 @@ from datetime import datetime, timedelta
 clients = []
 properties = []
 rentals = []
+active_rentals = []  # subset of rentals whose property is still rented out
 
 # -----------------------------
 #        DATA MODELS
 # -----------------------------
 class Client:
+    __slots__ = ('id', 'name', 'email', 'phone', 'address')
+
     def __init__(self, name, email=None, phone=None, address=None):
         self.id = len(clients) + 1
         self.name = name
@@ -19,6 +24,8 @@ class Client:
         self.address = address
 
 class Property:
+    __slots__ = ('id', 'category', 'kind', 'address', 'floor_area', 'rent_amount',
+                 'rent_period', 'description', 'available')
     RENT_PERIODS = ['monthly', 'yearly']
 
     def __init__(self, category, kind=None, address=None, floor_area=0, rent_amount=0, rent_period='monthly', description=''):
@@ -40,31 +47,44 @@ class Property:
         return info
 
 class Commercial(Property):
+    __slots__ = ()
+
     def __init__(self, kind, address, floor_area, rent_amount, rent_period, description):
         super().__init__('commercial', kind, address, floor_area, rent_amount, rent_period, description)
 
 class Residential(Property):
+    __slots__ = ('bedrooms', 'bathrooms')
+
     def __init__(self, kind, address, floor_area, rent_amount, rent_period, description, bedrooms=0, bathrooms=0):
         super().__init__('residential', kind, address, floor_area, rent_amount, rent_period, description)
         self.bedrooms = bedrooms
         self.bathrooms = bathrooms
 
 class Land(Property):
+    __slots__ = ('land_use',)
+
     def __init__(self, address, floor_area, rent_amount, rent_period, description, land_use=None):
         super().__init__('land', None, address, floor_area, rent_amount, rent_period, description)
         self.land_use = land_use
 
 class Resorts(Property):
+    __slots__ = ('amenities',)
+
     def __init__(self, kind, address, floor_area, rent_amount, rent_period, description, amenities=None):
         super().__init__('resorts', kind, address, floor_area, rent_amount, rent_period, description)
         self.amenities = amenities
 
 class Venues(Property):
+    __slots__ = ('capacity',)
+
     def __init__(self, kind, address, floor_area, rent_amount, rent_period, description, capacity=0):
         super().__init__('venues', kind, address, floor_area, rent_amount, rent_period, description)
         self.capacity = capacity
 
 class Rental:
+    __slots__ = ('client', 'property', 'start_date', 'end_date', 'total_amount',
+                 'payment_frequency', 'next_due_date')
+
     def __init__(self, client, property, start_date, end_date, total_amount, payment_frequency='monthly'):
         self.client = client
         self.property = property
@@ -90,36 +110,50 @@ class Rental:
 # -----------------------------
 #        INPUT HELPERS
 # -----------------------------
+def _ask(prompt):
+    # input() without the readline hook; same result for piped input
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
 def input_float(prompt):
     while True:
         try:
-            return float(input(prompt))
+            return float(_ask(prompt))
         except ValueError:
             print("Invalid input. Enter a number.")
 
 def input_int(prompt):
     while True:
         try:
-            return int(input(prompt))
+            return int(_ask(prompt))
         except ValueError:
             print("Invalid input. Enter an integer.")
 
 def input_yes_no(prompt):
     while True:
-        ans = input(prompt).lower()
+        ans = _ask(prompt).lower()
         if ans in ['yes', 'y']:
             return True
         elif ans in ['no', 'n']:
             return False
         print("Please answer yes or no.")
 
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 def input_date(prompt):
     while True:
-        val = input(prompt)
-        try:
-            return datetime.strptime(val, '%Y-%m-%d').date()
-        except ValueError:
-            print("Invalid date format. Use YYYY-MM-DD.")
+        val = _ask(prompt)
+        # fromisoformat alone would also take 20240101 or 2024-W01-1
+        if _DATE_RE.fullmatch(val):
+            try:
+                return date.fromisoformat(val)
+            except ValueError:
+                pass
+        print("Invalid date format. Use YYYY-MM-DD.")
 
 # -----------------------------
 #        FEATURES
@@ -127,37 +161,37 @@ def input_date(prompt):
 def add_property():
     print("\n=== Add New Property ===")
     print("Available categories: commercial, residential, land, resorts, venues")
-    category = input("Enter category: ").strip().lower()
+    category = _ask("Enter category: ").strip().lower()
     if category not in ['commercial', 'residential', 'land', 'resorts', 'venues']:
         print("Invalid category!")
         return
 
-    address = input("Enter address: ")
+    address = _ask("Enter address: ")
     floor_area = input_float("Enter floor area (sqm): ")
     yearly_rent = input_float("Enter yearly rent amount: ")
     monthly_rent = input_float("Enter monthly rent amount: ")
     print("Rent periods: monthly, yearly")
-    rent_period = input("Enter rent period: ").strip().lower()
+    rent_period = _ask("Enter rent period: ").strip().lower()
     rent_amount = yearly_rent if rent_period == 'yearly' else monthly_rent
-    description = input("Enter description of property: ")
+    description = _ask("Enter description of property: ")
 
     if category == 'commercial':
-        kind = input("Enter kind (e.g., office, warehouse, retail space, etc.): ")
+        kind = _ask("Enter kind (e.g., office, warehouse, retail space, etc.): ")
         prop = Commercial(kind, address, floor_area, rent_amount, rent_period, description)
     elif category == 'residential':
-        kind = input("Enter kind (e.g., house, condo, apartment): ")
+        kind = _ask("Enter kind (e.g., house, condo, apartment): ")
         bedrooms = input_int("Enter number of bedrooms: ")
         bathrooms = input_int("Enter number of bathrooms: ")
         prop = Residential(kind, address, floor_area, rent_amount, rent_period, description, bedrooms, bathrooms)
     elif category == 'land':
-        land_use = input("Enter land use (agricultural, residential, commercial): ")
+        land_use = _ask("Enter land use (agricultural, residential, commercial): ")
         prop = Land(address, floor_area, rent_amount, rent_period, description, land_use)
     elif category == 'resorts':
-        kind = input("Enter kind (e.g., beach resort, mountain resort): ")
-        amenities = input("Enter amenities (pool, spa, gym, etc.): ")
+        kind = _ask("Enter kind (e.g., beach resort, mountain resort): ")
+        amenities = _ask("Enter amenities (pool, spa, gym, etc.): ")
         prop = Resorts(kind, address, floor_area, rent_amount, rent_period, description, amenities)
     elif category == 'venues':
-        kind = input("Enter kind (e.g., wedding venue, conference hall): ")
+        kind = _ask("Enter kind (e.g., wedding venue, conference hall): ")
         capacity = input_int("Enter capacity: ")
         prop = Venues(kind, address, floor_area, rent_amount, rent_period, description, capacity)
 
@@ -169,8 +203,7 @@ def view_properties():
         print("No properties available.")
         return
     print("\n--- Properties ---")
-    for p in properties:
-        print(p.display_info())
+    sys.stdout.write("\n".join(p.display_info() for p in properties) + "\n")
     print("------------------")
 
 def view_clients():
@@ -178,10 +211,13 @@ def view_clients():
         print("No clients found.")
         return
     print("\n=== Clients with Rentals ===")
+    # Index rentals by client once instead of rescanning the list per client
+    by_client = {}
+    for r in rentals:
+        by_client.setdefault(r.client.id, []).append(r)
     for c in clients:
         print(f"Client: {c.name} | Email: {c.email or 'N/A'} | Address: {c.address or 'N/A'} | Phone: {c.phone or 'N/A'}")
-        client_rentals = [r for r in rentals if r.client == c]
-        for r in client_rentals:
+        for r in by_client.get(c.id, ()):
             print(f"  - Rented: {r.property.kind or 'Land'} in {r.property.address} | Next Due: {r.next_due_date}")
     print("------------------")
 
@@ -202,10 +238,10 @@ def rent_property():
         return
     prop = available_props[choice]
 
-    name = input("Enter client name: ")
-    email = input("Enter client email: ")
-    phone = input("Enter client phone: ")
-    address = input("Enter client address: ")
+    name = _ask("Enter client name: ")
+    email = _ask("Enter client email: ")
+    phone = _ask("Enter client phone: ")
+    address = _ask("Enter client address: ")
     client = Client(name, email, phone, address)
     clients.append(client)
 
@@ -218,20 +254,25 @@ def rent_property():
     duration_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
     total_amount = prop.rent_amount * duration_months if prop.rent_period=='monthly' else (prop.rent_amount/12)*duration_months
 
-    payment_frequency = input("Enter payment frequency (monthly/yearly): ").strip().lower()
+    payment_frequency = _ask("Enter payment frequency (monthly/yearly): ").strip().lower()
     rental = Rental(client, prop, start_date, end_date, total_amount, payment_frequency)
     rentals.append(rental)
+    active_rentals.append(rental)
     print(f"Property rented successfully to {client.name}. Total amount: {total_amount:.2f}")
 
+def end_rental(rental):
+    active_rentals.remove(rental)
+    rental.property.available = True
+
 def view_rentals():
-    if not rentals:
+    if not active_rentals:
         print("No active rentals.")
         return
     print("\n=== Currently Rented Properties ===")
-    for r in rentals:
-        if not r.property.available:
-            remaining_days = (r.end_date - datetime.today().date()).days
-            print(f"Property: {r.property.kind or 'Land'} in {r.property.address} | Rented by: {r.client.name} | Remaining Days: {remaining_days}")
+    today = datetime.today().date()
+    for r in active_rentals:
+        remaining_days = (r.end_date - today).days
+        print(f"Property: {r.property.kind or 'Land'} in {r.property.address} | Rented by: {r.client.name} | Remaining Days: {remaining_days}")
     print("------------------")
 
 def view_due_payments():
@@ -258,7 +299,7 @@ def main_menu():
         print("4) Rentals - View currently rented properties")
         print("5) Due Payments - View payments due in 1 month")
         print("6) Exit")
-        choice = input("Choose option: ").strip()
+        choice = _ask("Choose option: ").strip()
         if choice == '1':
             view_clients()
         elif choice == '2':
@@ -267,7 +308,7 @@ def main_menu():
                 print("1) View Properties")
                 print("2) Add Property")
                 print("3) Back to Main Menu")
-                sub_choice = input("Choose option: ").strip()
+                sub_choice = _ask("Choose option: ").strip()
                 if sub_choice == '1':
                     view_properties()
                 elif sub_choice == '2':